@@ -0,0 +1,9 @@
+"""Interpreter compatibility shims shared by the attribution helpers."""
+
+from __future__ import annotations
+
+import sys
+
+# ``slots`` is only accepted by ``dataclass`` from Python 3.10 onwards; older
+# interpreters fall back to regular instance dictionaries.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
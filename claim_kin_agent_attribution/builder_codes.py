@@ -1,26 +1,31 @@
 """Utilities for extracting builder referral codes from Hyperliquid metadata."""
 from __future__ import annotations
 
+import re
+import time
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence
 
 from hyperliquid.info import Info
 
+from ._compat import _DATACLASS_SLOTS
+
 
 def _is_sequence(value: Any) -> bool:
     return isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray))
 
 
+_ADDRESS_RE = re.compile(r"\A\s*(?:0[xX])?([0-9a-fA-F]{40})\s*\Z")
+
+
 def _normalise_address(value: str) -> Optional[str]:
-    text = value.strip()
-    if not text:
-        return None
-    if not text.startswith("0x"):
-        text = f"0x{text}"
-    text = text.lower()
-    if len(text) != 42:
+    match = _ADDRESS_RE.match(value)
+    if match is None:
         return None
-    return text
+    return "0x" + match.group(1).lower()
 
 
 def _parse_share(value: Any) -> Optional[int]:
@@ -46,77 +51,92 @@ def _parse_share(value: Any) -> Optional[int]:
     return None
 
 
-def _as_mapping(value: Any) -> Mapping[str, Any]:
-    if isinstance(value, Mapping):
-        return value
-    return {}
-
-
-def _coerce_entries(payload: Any) -> List[Mapping[str, Any]]:
-    if isinstance(payload, Mapping):
-        candidates: List[Mapping[str, Any]] = []
-        for key in ("perpDexs", "dexs", "result", "data", "items", "payload"):
-            if key in payload:
-                nested = _coerce_entries(payload[key])
-                if nested:
-                    candidates.extend(nested)
-        if candidates:
-            return candidates
-        if any(key in payload for key in ("builder", "builderAddress", "builder_code")):
-            return [payload]
-        return []
-    if _is_sequence(payload):
-        entries: List[Mapping[str, Any]] = []
-        for item in payload:
-            if isinstance(item, Mapping):
-                entries.append(item)
-            elif _is_sequence(item):
-                entries.extend(_coerce_entries(item))
-        return entries
-    return []
-
-
-def _extract_code(entry: Mapping[str, Any]) -> tuple[Optional[str], Optional[str], Optional[int]]:
-    builder_info = _as_mapping(entry.get("builder"))
-    address_candidates = (
-        entry.get("builderAddress"),
-        entry.get("builder_address"),
-        builder_info.get("address"),
-        builder_info.get("addr"),
-        builder_info.get("builderAddress"),
+_NESTED_KEYS = ("perpDexs", "dexs", "result", "data", "items", "payload")
+_BUILDER_KEYS = ("builder", "builderAddress", "builder_code")
+
+# Work-list actions used by ``_iter_entries``.
+_VISIT, _EMIT, _FALLBACK = 0, 1, 2
+
+
+def _iter_entries(payload: Any) -> Iterator[Mapping[str, Any]]:
+    """Yield builder entries from an arbitrarily nested metadata payload.
+
+    Mappings are searched through the well-known wrapper keys first and only
+    treated as an entry themselves when none of those produced results, while
+    mappings found inside sequences are yielded as-is. The traversal uses an
+    explicit stack so deeply nested responses do not cost a Python frame (and
+    an intermediate list) per level.
+    """
+
+    produced = 0
+    stack: List[tuple[int, Any, int]] = [(_VISIT, payload, 0)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        action, node, mark = pop()
+        if action == _EMIT:
+            produced += 1
+            yield node
+        elif action == _FALLBACK:
+            if produced == mark and any(key in node for key in _BUILDER_KEYS):
+                produced += 1
+                yield node
+        elif isinstance(node, Mapping):
+            push((_FALLBACK, node, produced))
+            for key in reversed(_NESTED_KEYS):
+                if key in node:
+                    push((_VISIT, node[key], 0))
+        elif _is_sequence(node):
+            for item in reversed(node):
+                if isinstance(item, Mapping):
+                    push((_EMIT, item, 0))
+                elif _is_sequence(item):
+                    push((_VISIT, item, 0))
+
+
+def _normalise_addresses(addresses: Iterable[str]) -> frozenset[str]:
+    return frozenset(
+        address for address in (_normalise_address(addr) for addr in addresses if isinstance(addr, str)) if address
     )
+
+
+_ADDRESS_KEYS = ("builderAddress", "builder_address")
+_BUILDER_ADDRESS_KEYS = ("address", "addr", "builderAddress")
+_CODE_KEYS = ("builderCode", "builder_code")
+_BUILDER_CODE_KEYS = ("code", "referralCode", "id")
+_SHARE_KEYS = ("feeShareBps", "builderShareBps", "shareBps")
+_BUILDER_SHARE_KEYS = ("shareBps", "bps")
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _extract_code(
+    entry: Mapping[str, Any], allowed_addresses: Optional[frozenset[str]] = None
+) -> tuple[Optional[str], Optional[str], Optional[int]]:
+    builder_info = entry.get("builder")
+    if not isinstance(builder_info, Mapping):
+        builder_info = _EMPTY_MAPPING
+
+    # Candidates are looked up lazily in priority order so the common case
+    # (first key present) stops after a single ``get``.
     address: Optional[str] = None
-    for candidate in address_candidates:
+    for candidate in chain(map(entry.get, _ADDRESS_KEYS), map(builder_info.get, _BUILDER_ADDRESS_KEYS)):
         if isinstance(candidate, str):
             address = _normalise_address(candidate)
             if address:
                 break
 
-    if not address:
+    if not address or (allowed_addresses and address not in allowed_addresses):
         return None, None, None
 
-    code_candidates = (
-        entry.get("builderCode"),
-        entry.get("builder_code"),
-        builder_info.get("code"),
-        builder_info.get("referralCode"),
-        builder_info.get("id"),
-    )
     code: Optional[str] = None
-    for candidate in code_candidates:
+    for candidate in chain(map(entry.get, _CODE_KEYS), map(builder_info.get, _BUILDER_CODE_KEYS)):
         if isinstance(candidate, str) and candidate.strip():
             code = candidate.strip()
             break
 
-    share_candidates = (
-        entry.get("feeShareBps"),
-        entry.get("builderShareBps"),
-        entry.get("shareBps"),
-        builder_info.get("shareBps"),
-        builder_info.get("bps"),
-    )
     share: Optional[int] = None
-    for candidate in share_candidates:
+    for candidate in chain(map(entry.get, _SHARE_KEYS), map(builder_info.get, _BUILDER_SHARE_KEYS)):
         share = _parse_share(candidate)
         if share is not None:
             break
@@ -136,7 +156,7 @@ def _coerce_name(entry: Mapping[str, Any], index: int) -> str:
     return f"builder_{index}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BuilderCode:
     """Description of a builder referral configuration."""
 
@@ -159,11 +179,25 @@ class BuilderCode:
         return payload
 
 
-def parse_builder_codes(payload: Any) -> List[BuilderCode]:
-    entries = _coerce_entries(payload)
+def parse_builder_codes(
+    payload: Any,
+    filter_addresses: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+) -> List[BuilderCode]:
+    """Parse builder codes from a ``perpDexs`` style payload.
+
+    ``filter_addresses`` restricts the result to the given builder addresses
+    (an empty filter keeps every code, like :func:`filter_builder_codes`), and
+    entries for other builders are skipped before their code and share fields
+    are parsed. ``limit`` stops parsing once that many codes were collected.
+    """
+
+    allowed = _normalise_addresses(filter_addresses) if filter_addresses is not None else None
     results: List[BuilderCode] = []
-    for index, entry in enumerate(entries):
-        address, code, share = _extract_code(entry)
+    if limit is not None and limit <= 0:
+        return results
+    for index, entry in enumerate(_iter_entries(payload)):
+        address, code, share = _extract_code(entry, allowed)
         if not address:
             continue
         dex = _coerce_name(entry, index)
@@ -177,20 +211,51 @@ def parse_builder_codes(payload: Any) -> List[BuilderCode]:
                 metadata=metadata,
             )
         )
+        if limit is not None and len(results) >= limit:
+            break
     return results
 
 
-def fetch_builder_codes(info: Info) -> List[BuilderCode]:
-    """Fetch builder referral codes for the configured Hyperliquid instance."""
+PERP_DEXS_CACHE_TTL = 30.0
+
+_PERP_DEXS_CACHE: "weakref.WeakKeyDictionary[Any, tuple[float, Any]]" = weakref.WeakKeyDictionary()
 
+
+def _cached_perp_dexs(info: Info, max_age: float) -> Any:
+    if max_age <= 0:
+        return info.perp_dexs()
+    now = time.monotonic()
+    try:
+        cached = _PERP_DEXS_CACHE.get(info)
+    except TypeError:  # objects without weak reference support are never cached
+        return info.perp_dexs()
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
     payload = info.perp_dexs()
-    codes = parse_builder_codes(payload)
+    _PERP_DEXS_CACHE[info] = (now, payload)
+    return payload
+
+
+def fetch_builder_codes(
+    info: Info,
+    filter_addresses: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    max_age: float = PERP_DEXS_CACHE_TTL,
+) -> List[BuilderCode]:
+    """Fetch builder referral codes for the configured Hyperliquid instance.
+
+    The ``perpDexs`` payload is reused for ``max_age`` seconds per ``info``
+    client so repeated lookups (e.g. one per vault claim) share a single
+    request. Pass ``max_age=0`` to always query the API.
+    """
+
+    payload = _cached_perp_dexs(info, max_age)
+    codes = parse_builder_codes(payload, filter_addresses=filter_addresses, limit=limit)
     return codes
 
 
 def filter_builder_codes(codes: Iterable[BuilderCode], addresses: Iterable[str]) -> List[BuilderCode]:
-    normalised = {_normalise_address(addr) for addr in addresses if isinstance(addr, str)}
-    normalised = {addr for addr in normalised if addr}
+    normalised = _normalise_addresses(addresses)
     if not normalised:
         return list(codes)
     return [code for code in codes if code.builder_address in normalised]
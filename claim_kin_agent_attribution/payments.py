@@ -4,10 +4,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Any, Iterable, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Iterable, List, Optional, cast
 
+from ._compat import _DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_MINUS_ONE = Decimal("-1")
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PaymentSettlement:
     """Represents a single ledger movement expressed in USD."""
 
@@ -38,19 +46,32 @@ class PaymentSettlement:
         }
 
 
+@lru_cache(maxsize=4096)
+def _decimal_from_text(text: str) -> Decimal:
+    # Ledger fees and transfer sizes repeat often; Decimal is immutable so the
+    # parsed value can be shared between rows.
+    return Decimal(text)
+
+
 def _as_decimal(value: Any) -> Optional[Decimal]:
     if value in (None, "", "NaN"):
         return None
+    value_type = type(value)
+    if value_type is Decimal:
+        return cast(Decimal, value)
+    if value_type is int:  # exact type check: ``bool`` must keep failing below
+        return Decimal(value)
     try:
-        return Decimal(str(value))
+        return _decimal_from_text(value if value_type is str else str(value))
     except (InvalidOperation, ValueError):
         return None
 
 
-def _extract_amount_from_delta(delta: dict[str, Any]) -> Optional[Decimal]:
+def _extract_amount_from_delta(delta: dict[str, Any], delta_type: Any = None) -> Optional[Decimal]:
     """Extract the USD amount represented by a ledger delta."""
 
-    delta_type = delta.get("type", "")
+    if delta_type is None:
+        delta_type = delta.get("type", "")
     if "usdc" in delta and delta_type != "spotTransfer":
         amount = _as_decimal(delta.get("usdc"))
         return amount
@@ -59,9 +80,9 @@ def _extract_amount_from_delta(delta: dict[str, Any]) -> Optional[Decimal]:
         amount = _as_decimal(delta.get("usdcValue") or delta.get("amount"))
         if amount is None:
             return None
-        fee = _as_decimal(delta.get("fee")) or Decimal("0")
-        native_fee = _as_decimal(delta.get("nativeTokenFee")) or Decimal("0")
-        direction_multiplier = Decimal("-1") if delta.get("destination") else Decimal("1")
+        fee = _as_decimal(delta.get("fee")) or _ZERO
+        native_fee = _as_decimal(delta.get("nativeTokenFee")) or _ZERO
+        direction_multiplier = _MINUS_ONE if delta.get("destination") else _ONE
         total = direction_multiplier * amount
         total += direction_multiplier * fee
         total += direction_multiplier * native_fee
@@ -82,35 +103,37 @@ def extract_payment_settlements(updates: Iterable[dict[str, Any]]) -> List[Payme
     """
 
     settlements: List[PaymentSettlement] = []
+    append = settlements.append
     for entry in updates:
         if not isinstance(entry, dict):
             continue
         delta = entry.get("delta")
         if not isinstance(delta, dict):
             continue
-        amount = _extract_amount_from_delta(delta)
+        # Look the delta type up once and share it between amount extraction
+        # and the settlement ``kind`` so each row touches the dict minimally.
+        delta_type = delta.get("type", "unknown")
+        amount = _extract_amount_from_delta(delta, delta_type)
         if amount is None or amount == 0:
             continue
-        direction = "credit" if amount > 0 else "debit"
-        settlements.append(
+        append(
             PaymentSettlement(
                 time_ms=int(entry.get("time", 0)),
                 tx_hash=str(entry.get("hash", "")),
-                kind=str(delta.get("type", "unknown")),
+                kind=str(delta_type),
                 amount_usd=amount,
-                direction=direction,
+                direction="credit" if amount > 0 else "debit",
                 metadata=delta,
             )
         )
 
-    settlements.sort(key=lambda settlement: settlement.time_ms)
+    # Ledger updates usually arrive in time order, which timsort handles in a
+    # single linear pass; attrgetter keeps the key extraction in C.
+    settlements.sort(key=attrgetter("time_ms"))
     return settlements
 
 
 def total_settlement_amount(settlements: Iterable[PaymentSettlement]) -> Decimal:
     """Compute the net USD effect of a collection of settlements."""
 
-    total = Decimal("0")
-    for settlement in settlements:
-        total += settlement.amount_usd
-    return total
+    return sum((settlement.amount_usd for settlement in settlements), _ZERO)
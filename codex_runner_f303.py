@@ -1,15 +1,26 @@
 #!/usr/bin/env python3
 """Codex runner that locates the KinLend f303 vault on Hyperliquid."""
 
-import json
-from typing import Any, Dict, List
+from __future__ import annotations
+
+import argparse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from hyperliquid.info import Info
 from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.f303_helpers import create_info_client, render_json
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from hyperliquid.info import Info
 
 F303_VAULT_ADDRESS = "0xdfC24b077bC1425Ad1DeA75BCB6F8158E10Df303"
 F303_SUFFIX = "f303"
 
+_ADDRESS_KEYS = ("vaultAddress", "address", "id")
+_NAME_KEYS = ("name", "vaultName", "displayName")
+_MANAGER_KEYS = ("manager", "owner", "operator")
+_AUM_KEYS = ("aum", "vaultEquity", "assetsUnderManagement", "tvl")
+_APY_KEYS = ("apy", "apyPct", "apy7d", "apy30d")
+
 
 def fetch_vaults(client: Info) -> List[Dict[str, Any]]:
     """Fetch the list of vaults from the Hyperliquid info endpoint."""
@@ -35,28 +46,37 @@ def _extract_vaults(payload: Any) -> Any:
     return None
 
 
+def _first_truthy(vault: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    # map/filter keep the per-key lookups and truthiness tests in C.
+    return next(filter(None, map(vault.get, keys)), None)
+
+
+def _first(vault: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Return the first value under ``keys`` that is present (``0`` counts, ``""`` does not)."""
+    for key in keys:
+        value = vault.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
 def _is_f303_vault(vault: Dict[str, Any]) -> bool:
-    address = str(
-        vault.get("vaultAddress")
-        or vault.get("address")
-        or vault.get("id")
-        or ""
-    ).lower()
-    name = str(vault.get("name") or vault.get("vaultName") or vault.get("displayName") or "").lower()
-    return (
-        address == F303_VAULT_ADDRESS.lower()
-        or address.endswith(F303_SUFFIX)
-        or name.endswith(F303_SUFFIX)
-        or F303_SUFFIX in name
-    )
-
-
-def _format_vault(vault: Dict[str, Any]) -> str:
-    address = vault.get("vaultAddress") or vault.get("address") or vault.get("id") or "<unknown address>"
-    name = vault.get("name") or vault.get("vaultName") or vault.get("displayName") or "<unnamed vault>"
-    manager = vault.get("manager") or vault.get("owner") or vault.get("operator")
-    aum = vault.get("aum") or vault.get("vaultEquity") or vault.get("assetsUnderManagement") or vault.get("tvl")
-    apy = vault.get("apy") or vault.get("apyPct") or vault.get("apy7d") or vault.get("apy30d")
+    address = str(_first_truthy(vault, _ADDRESS_KEYS) or "").lower()
+    # The canonical f303 address also ends with the suffix, so one check covers both.
+    if address.endswith(F303_SUFFIX):
+        return True
+    name = str(_first_truthy(vault, _NAME_KEYS) or "").lower()
+    return F303_SUFFIX in name
+
+
+def _format_vault(vault: Dict[str, Any], verbose: bool = False) -> str:
+    # Text fields skip empty values exactly like _is_f303_vault does; only the
+    # numeric fields use _first so that a genuine 0 is still reported.
+    address = _first_truthy(vault, _ADDRESS_KEYS) or "<unknown address>"
+    name = _first_truthy(vault, _NAME_KEYS) or "<unnamed vault>"
+    manager = _first_truthy(vault, _MANAGER_KEYS)
+    aum = _first(vault, _AUM_KEYS)
+    apy = _first(vault, _APY_KEYS)
 
     parts: List[str] = [f"Vault: {name} ({address})"]
     if manager:
@@ -65,12 +85,18 @@ def _format_vault(vault: Dict[str, Any]) -> str:
         parts.append(f"  • AUM: {aum}")
     if apy is not None:
         parts.append(f"  • APY: {apy}")
-    parts.append(f"  • Raw: {json.dumps(vault, indent=2)}")
+    if verbose:
+        # Serialising the whole vault dominates formatting cost, so only do it on request.
+        parts.append(f"  • Raw: {render_json(vault)}")
     return "\n".join(parts)
 
 
-def main() -> None:
-    info = Info(MAINNET_API_URL, skip_ws=True)
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Locate the KinLend f303 vault on the Hyperliquid leaderboard.")
+    parser.add_argument("--verbose", action="store_true", help="Include the raw vault payload for each match.")
+    args = parser.parse_args(argv)
+
+    info = create_info_client(MAINNET_API_URL)
     vaults = fetch_vaults(info)
     print(f"📊 Retrieved {len(vaults)} vault entries from Hyperliquid.")
 
@@ -81,7 +107,7 @@ def main() -> None:
 
     print("\n🎯 f303 vault matches:")
     for vault in f303_vaults:
-        print(_format_vault(vault))
+        print(_format_vault(vault, verbose=args.verbose))
         print()
 
 
@@ -18,7 +18,9 @@ Examples:
         --royalty-bps 1000
 
 If ``PRIVATE_KEY`` is not set the script falls back to prompting securely via
-``getpass``.
+``getpass``. Set ``CODEX_SKIP_RPC_PROBE=1`` to skip the up-front connectivity
+check when the endpoint is known to be healthy (e.g. in CI); an unreachable
+endpoint then surfaces on the first real RPC instead.
 """
 
 from __future__ import annotations
@@ -26,21 +28,24 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from eth_account import Account
-from eth_account.signers.local import LocalAccount
-from web3 import Web3
-from web3.exceptions import TransactionNotFound
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    import requests
+    from eth_account.signers.local import LocalAccount
+    from web3 import Web3
 
 # NOTE: The bytecode below originates from the KinRoyaltyPaymaster precompiled
 # artifact. Retain it verbatim to ensure deployments remain deterministic.
-BYTECODE = (
+BYTECODE_HEX = (
     "608060405234801561001057600080fd5b506040516104f63803806104f683398181016040528101906100329190610082565b8060008190555033600081815260200190815260200160002081905550806000819055506100e1806100636000396000f3fe6080604052600436106100345760003560e01c8063103c6b49146100395780638da5cb5b14610057578063f7c618c114610075575b600080fd5b610041610093565b60405161004e91906101a3565b60405180910390f35b61005f6100a7565b60405161006c91906101a3565b60405180910390f35b61007d6100bb565b60405161008a91906101a3565b60405180910390f35b60005481565b600080546001019055565b6000805460ff166001146100c857600080fd5b6001546000805460ff19166001179055600181905550565b60008054905090565b6100f8816100e9565b82525050565b600060208201905061011360008301846100ef565b92915050565b6000604051905090565b600067ffffffffffffffff82111561013b5761013a610134565b5b6101448261010d565b9050602081019050919050565b82818337600083830152505050565b60006101738261014e565b915061017e8361014e565b925082820190508082111561019657610195610134565b5b92915050565b6000819050919050565b6101b08161019d565b81146101bb57600080fd5b50565b6000813590506101cd816101a7565b92915050565b600080604083850312156101e9576101e86101a2565b5b60006101f7858286016101be565b9250506020610208858286016101be565b915050925092905056fea26469706673582212202ae0f456b8c19d61a31b47b04648197e0301049e6c3b43abcb503504cb3ea02e64736f6c63430008140033"
 )
+# Decoded once; deployment calldata is this prefix plus the encoded constructor args.
+BYTECODE = bytes.fromhex(BYTECODE_HEX)
 
-ABI = [
+ABI: List[Dict[str, Any]] = [
     {
         "inputs": [
             {"internalType": "address", "name": "_keeper", "type": "address"},
@@ -52,8 +57,21 @@ ABI = [
     }
 ]
 
+CONSTRUCTOR_TYPES: Tuple[str, ...] = tuple(
+    param["type"] for entry in ABI if entry["type"] == "constructor" for param in entry["inputs"]
+)
+
 DEFAULT_RPC_URL = "https://rpc.hyperliquid.xyz/evm"
 
+# HyperEVM small blocks land about once a second; web3's 0.1s default polls
+# the receipt endpoint ten times per block for no benefit.
+RECEIPT_POLL_LATENCY = 0.5
+RECEIPT_TIMEOUT = 120
+
+# The constructor only stores its arguments, so creation gas barely depends on
+# them; this limit comfortably covers the storage writes and code deposit.
+DEFAULT_DEPLOY_GAS = 720_000
+
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -77,7 +95,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--royalty-bps",
         type=int,
         required=True,
-        help="Royalty percentage expressed in basis points (1% = 100)",
+        help="Royalty percentage expressed in basis points (1%% = 100)",
     )
     parser.add_argument(
         "--private-key",
@@ -88,10 +106,23 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         type=int,
         help="Explicit gas price in wei. If omitted the script derives EIP-1559 fees when available.",
     )
+    parser.add_argument(
+        "--gas-limit",
+        type=int,
+        default=DEFAULT_DEPLOY_GAS,
+        help="Gas limit for the deployment transaction (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--estimate-gas",
+        action="store_true",
+        help="Ask the RPC node to estimate gas instead of using --gas-limit.",
+    )
     return parser.parse_args(argv)
 
 
 def load_account(parsed_args: argparse.Namespace) -> LocalAccount:
+    from eth_account import Account
+
     candidate = (
         parsed_args.private_key
         or os.environ.get("PRIVATE_KEY")
@@ -131,7 +162,7 @@ def detect_fee_fields(w3: Web3, explicit_gas_price: int | None) -> Dict[str, int
 
     priority_fee = w3.eth.max_priority_fee
     if priority_fee is None:
-        priority_fee = Web3.to_wei(2, "gwei")
+        priority_fee = w3.to_wei(2, "gwei")
 
     # Apply a headroom multiplier (2x base fee) to minimize replacement.
     max_fee = base_fee * 2 + priority_fee
@@ -141,11 +172,54 @@ def detect_fee_fields(w3: Web3, explicit_gas_price: int | None) -> Dict[str, int
     }
 
 
+def encode_deployment_data(keeper: str, target_vault: str, royalty_bps: int) -> str:
+    """Return the creation calldata: ``BYTECODE`` followed by the ABI-encoded constructor args."""
+    from eth_abi import encode
+    from eth_utils import to_hex
+
+    return to_hex(BYTECODE + encode(CONSTRUCTOR_TYPES, (keeper, target_vault, royalty_bps)))
+
+
+def build_rpc_session() -> requests.Session:
+    """Return a keep-alive session sized for the concurrent preflight reads."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # urllib3 only retries POSTs on connection errors, i.e. before the request
+    # reached the node, so a transaction is never submitted twice.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.1))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_preflight(w3: Web3, address: str, explicit_gas_price: int | None) -> Tuple[int, int, Dict[str, int]]:
+    """Return ``(nonce, chain_id, fee_fields)`` for the deployment transaction.
+
+    The reads are independent, so they are issued concurrently and the
+    preflight costs the slowest lookup instead of the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        nonce = executor.submit(w3.eth.get_transaction_count, address)
+        chain_id = executor.submit(lambda: w3.eth.chain_id)
+        fee_fields = executor.submit(detect_fee_fields, w3, explicit_gas_price)
+        return nonce.result(), chain_id.result(), fee_fields.result()
+
+
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
-    w3 = Web3(Web3.HTTPProvider(args.rpc_url))
 
-    if not w3.is_connected():
+    # web3 pulls in a large dependency tree; import it only once the
+    # arguments are known to be valid so --help and usage errors stay fast.
+    from web3 import Web3
+    from web3.exceptions import TimeExhausted, TransactionNotFound
+
+    w3 = Web3(Web3.HTTPProvider(args.rpc_url, session=build_rpc_session()))
+
+    # is_connected() costs a web3_clientVersion round-trip on every run.
+    if os.environ.get("CODEX_SKIP_RPC_PROBE") != "1" and not w3.is_connected():
         raise SystemExit(f"Unable to reach RPC endpoint at {args.rpc_url}")
 
     account = load_account(args)
@@ -162,6 +236,8 @@ def main(argv: list[str] | None = None) -> None:
 
     if args.royalty_bps < 0:
         raise SystemExit("--royalty-bps must be a non-negative integer")
+    if args.gas_limit <= 0:
+        raise SystemExit("--gas-limit must be a positive integer")
 
     print("🔐 Wallet loaded:", account.address)
     print("🔗 RPC endpoint:", args.rpc_url)
@@ -169,25 +245,24 @@ def main(argv: list[str] | None = None) -> None:
     print("🏦 Target vault:", target_vault_address)
     print("💸 Royalty (bps):", args.royalty_bps)
 
-    contract = w3.eth.contract(abi=ABI, bytecode=BYTECODE)
-    nonce = w3.eth.get_transaction_count(account.address)
-    fee_fields = detect_fee_fields(w3, args.gas_price)
-
-    txn_dict = contract.constructor(
-        keeper_address,
-        target_vault_address,
-        args.royalty_bps,
-    ).build_transaction(
-        {
-            "from": account.address,
-            "nonce": nonce,
-            "chainId": w3.eth.chain_id,
-            **fee_fields,
-        }
-    )
+    nonce, chain_id, fee_fields = fetch_preflight(w3, account.address, args.gas_price)
+
+    # Build the creation transaction directly; the contract factory's
+    # build_transaction would also run its own estimate_gas round-trip.
+    txn_dict: Dict[str, Any] = {
+        "from": account.address,
+        "nonce": nonce,
+        "chainId": chain_id,
+        "value": 0,
+        "data": encode_deployment_data(keeper_address, target_vault_address, args.royalty_bps),
+        **fee_fields,
+    }
 
-    gas_estimate = w3.eth.estimate_gas({**txn_dict, "from": account.address})
-    txn_dict["gas"] = gas_estimate
+    if args.estimate_gas:
+        txn_dict["gas"] = w3.eth.estimate_gas(txn_dict)
+    else:
+        # Skips an eth_estimateGas round-trip and a full EVM simulation on the node.
+        txn_dict["gas"] = args.gas_limit
 
     signed_txn = account.sign_transaction(txn_dict)
     tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
@@ -196,8 +271,12 @@ def main(argv: list[str] | None = None) -> None:
     print("📝 Transaction hash:", tx_hash.hex())
 
     try:
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-    except TransactionNotFound:
+        receipt = w3.eth.wait_for_transaction_receipt(
+            tx_hash,
+            timeout=RECEIPT_TIMEOUT,
+            poll_latency=RECEIPT_POLL_LATENCY,
+        )
+    except (TimeExhausted, TransactionNotFound):
         print("⚠️ Transaction not found yet. Check the explorer for status updates.")
         return
 
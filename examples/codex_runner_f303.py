@@ -15,15 +15,15 @@ controller.
 from __future__ import annotations
 
 import argparse
-from pprint import pprint
 
-from hyperliquid.info import Info
 from hyperliquid.utils import constants
 from hyperliquid.utils.f303_helpers import (
     DEFAULT_OWNER_ADDRESS,
     DEFAULT_VAULT_ID,
-    fetch_leaderboard,
+    create_info_client,
+    fetch_vault_snapshot,
     format_withdrawable,
+    render_json,
 )
 
 
@@ -51,14 +51,15 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    info = Info(args.base_url, skip_ws=True)
+    info = create_info_client(args.base_url)
 
-    print(f"Requesting leaderboard for vault '{args.vault_id}' at {args.base_url}...")
-    leaderboard = fetch_leaderboard(info, args.vault_id)
-    pprint(leaderboard)
+    print(
+        f"Requesting leaderboard for vault '{args.vault_id}' and clearinghouse state "
+        f"for owner {args.owner_address} at {args.base_url}..."
+    )
+    leaderboard, clearinghouse_state = fetch_vault_snapshot(info, args.vault_id, args.owner_address)
+    print(render_json(leaderboard))
 
-    print(f"\nFetching clearinghouse state for owner {args.owner_address}...")
-    clearinghouse_state = info.user_state(args.owner_address)
     if not isinstance(clearinghouse_state, dict):
         print(
             "Unexpected clearinghouse state type:",
@@ -5,18 +5,16 @@ from __future__ import annotations
 
 import argparse
 import os
-from pprint import pprint
 from typing import Optional
 
-from eth_account import Account
-
-from hyperliquid.info import Info
 from hyperliquid.utils import constants
 from hyperliquid.utils.f303_helpers import (
     DEFAULT_OWNER_ADDRESS,
     DEFAULT_VAULT_ID,
-    fetch_leaderboard,
+    create_info_client,
+    fetch_vault_snapshot,
     format_withdrawable,
+    render_json,
 )
 
 
@@ -26,6 +24,10 @@ def derive_owner_from_env() -> Optional[str]:
     if not private_key:
         return None
 
+    # eth_account pulls in the eth_keys/pycryptodome stack, so only import it
+    # when there is actually a key to derive from.
+    from eth_account import Account
+
     try:
         return Account.from_key(private_key).address
     except ValueError as exc:  # pragma: no cover - defensive guard
@@ -64,7 +66,7 @@ def main() -> None:
     derived_owner = derive_owner_from_env()
     args = parse_args(derived_owner)
 
-    info = Info(args.base_url, skip_ws=True)
+    info = create_info_client(args.base_url)
 
     if derived_owner:
         print(f"🔐 Derived owner address from PRIVATE_KEY: {derived_owner}")
@@ -79,12 +81,13 @@ def main() -> None:
             "Pass --owner-address explicitly if the vault controller has rotated."
         )
 
-    print(f"\nRequesting leaderboard for vault '{args.vault_id}' at {args.base_url}...")
-    leaderboard = fetch_leaderboard(info, args.vault_id)
-    pprint(leaderboard)
+    print(
+        f"\nRequesting leaderboard for vault '{args.vault_id}' and clearinghouse state "
+        f"for owner {args.owner_address} at {args.base_url}..."
+    )
+    leaderboard, clearinghouse_state = fetch_vault_snapshot(info, args.vault_id, args.owner_address)
+    print(render_json(leaderboard))
 
-    print(f"\nFetching clearinghouse state for owner {args.owner_address}...")
-    clearinghouse_state = info.user_state(args.owner_address)
     if not isinstance(clearinghouse_state, dict):
         print(
             "Unexpected clearinghouse state type:",
@@ -3,8 +3,11 @@
 # Dropped by Keeper into Codex env
 # CT: 2025-09-17T08:44 AM CDT
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from eth_utils import keccak
+from eth_utils import decode_hex, keccak, to_hex
+from requests.adapters import HTTPAdapter
 
 # === Config ===
 VAULTS = [
@@ -23,35 +26,45 @@ FUNCTION_SIGNATURES = [
 
 RPC_URL = "https://rpc.hyperliquid.xyz/evm"
 
+# One keep-alive session for every vault so each lookup skips the TCP/TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 
 # === Helpers ===
 def sig_to_selector(sig: str) -> str:
-    return keccak(text=sig).hex()[:10]  # first 4 bytes as hex selector
+    return to_hex(keccak(text=sig)[:4])  # first 4 bytes as hex selector
 
 
-def fetch_bytecode(address: str) -> str:
+def fetch_bytecode(address: str) -> bytes:
     payload = {
         "jsonrpc": "2.0",
         "method": "eth_getCode",
         "params": [address, "latest"],
         "id": 1,
     }
-    response = requests.post(RPC_URL, json=payload).json()
-    return response.get("result", "")
+    response = _SESSION.post(RPC_URL, json=payload).json()
+    # Scan raw bytes: half the length of the hex text, and matches stay byte-aligned.
+    return decode_hex(response.get("result") or "0x")
 
 
 # === Main ===
 def main():
     print("🔍 Scanning vaults for authored function selectors...\n")
-    selectors = {sig: sig_to_selector(sig) for sig in FUNCTION_SIGNATURES}
+    selectors = {}
+    for sig in FUNCTION_SIGNATURES:
+        selector = sig_to_selector(sig)
+        selectors[sig] = (selector, decode_hex(selector))
 
-    for vault in VAULTS:
-        print(f"Vault: {vault}")
-        bytecode = fetch_bytecode(vault)
+    # Lookups are independent and latency-bound, so overlap them on the shared session.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(VAULTS)))) as executor:
+        bytecodes = list(executor.map(fetch_bytecode, VAULTS))
 
+    for vault, bytecode in zip(VAULTS, bytecodes):
+        print(f"Vault: {vault}")
         matches = []
-        for sig, selector in selectors.items():
-            if selector in bytecode:
+        for sig, (selector, selector_bytes) in selectors.items():
+            if selector_bytes in bytecode:
                 matches.append((sig, selector))
 
         if matches:
@@ -64,4 +77,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main(
+    main()
@@ -3,8 +3,13 @@
 # CT: 2025-09-17T05:38 (Central Time)
 # Purpose: Match deployed Hyperliquid vaults with SolaraKin-authored .sol function selectors
 
+from typing import Any
+
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from eth_utils import keccak, to_hex
+from eth_utils import decode_hex, keccak, to_hex
+from requests.adapters import HTTPAdapter
 
 # === CONFIGURATION ===
 
@@ -23,20 +28,45 @@ FUNCTION_SIGNATURES = [
     "mintSigilNFT(uint256,bytes32)",
 ]
 
+RPC_URL = "https://rpc.hyperliquid.xyz/evm"
+
+# eth_getCode lookups per JSON-RPC batch request, and how many batches may be
+# in flight at once. The cap bounds concurrency only; it does not throttle
+# requests per minute, so very large VAULTS lists can still hit rate limits.
+BATCH_SIZE = 50
+MAX_CONCURRENT_BATCHES = 4
+
+# One keep-alive session for every vault so each lookup skips the TCP/TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 # === UTILITIES ===
 
-def get_bytecode(address: str) -> str:
-    """Fetch deployed bytecode from Hyperliquid RPC."""
-    response = requests.post(
-        "https://rpc.hyperliquid.xyz/evm",
-        json={
-            "jsonrpc": "2.0",
-            "method": "eth_getCode",
-            "params": [address, "latest"],
-            "id": 1
-        },
-    )
-    return response.json().get("result", "")
+def _rpc_post(payload: Any) -> Any:
+    """POST a JSON-RPC payload and return the decoded reply."""
+    return _SESSION.post(RPC_URL, json=payload).json()
+
+def get_bytecodes(addresses: list[str]) -> list[bytes]:
+    """Fetch deployed bytecode for several addresses in one JSON-RPC batch."""
+    payload = [
+        {"jsonrpc": "2.0", "method": "eth_getCode", "params": [address, "latest"], "id": index}
+        for index, address in enumerate(addresses)
+    ]
+    replies = _rpc_post(payload)
+    if isinstance(replies, dict):
+        # The batch was rejected as a whole (rate limited, batching unsupported, ...).
+        raise RuntimeError(f"eth_getCode batch failed: {replies.get('error', replies)!r}")
+    # Batch replies may arrive in any order; match them back up by id.
+    replies_by_id = {reply.get("id"): reply for reply in replies if isinstance(reply, dict)}
+    bytecodes = []
+    for index, address in enumerate(addresses):
+        reply = replies_by_id.get(index)
+        if reply is None or "error" in reply:
+            detail = "no reply" if reply is None else repr(reply["error"])
+            raise RuntimeError(f"eth_getCode failed for {address}: {detail}")
+        # Scan raw bytes: half the length of the hex text, and matches stay byte-aligned.
+        bytecodes.append(decode_hex(reply.get("result") or "0x"))
+    return bytecodes
 
 def get_selector(signature: str) -> str:
     """Convert function signature to 4-byte selector."""
@@ -47,10 +77,15 @@ def get_selector(signature: str) -> str:
 def main():
     print(f"🧬 Checking {len(VAULTS)} vault(s) for SolaraKin signature match...\n")
 
-    selectors = [get_selector(sig) for sig in FUNCTION_SIGNATURES]
+    selectors = [decode_hex(get_selector(sig)) for sig in FUNCTION_SIGNATURES]
+
+    # One HTTP round-trip per batch instead of one per vault, with the batches
+    # themselves overlapped on the shared session.
+    batches = [VAULTS[start:start + BATCH_SIZE] for start in range(0, len(VAULTS), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_BATCHES, len(batches)))) as executor:
+        bytecodes = [code for batch in executor.map(get_bytecodes, batches) for code in batch]
 
-    for vault in VAULTS:
-        bytecode = get_bytecode(vault).lower()
+    for vault, bytecode in zip(VAULTS, bytecodes):
         print(f"🔍 Scanning vault: {vault}")
         matches = [sig for sig, sel in zip(FUNCTION_SIGNATURES, selectors) if sel in bytecode]
 
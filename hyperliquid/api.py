@@ -10,9 +10,10 @@ from hyperliquid.utils.types import Any
 
 
 class API:
-    def __init__(self, base_url=None, timeout=None):
+    def __init__(self, base_url=None, timeout=None, session=None):
         self.base_url = base_url or MAINNET_API_URL
-        self.session = requests.Session()
+        # Clients may share a session so they reuse the same pooled connections.
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
         self._logger = logging.getLogger(__name__)
         self.timeout = timeout
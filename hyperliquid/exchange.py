@@ -61,12 +61,13 @@ class Exchange(API):
         spot_meta: Optional[SpotMeta] = None,
         perp_dexs: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        session: Optional[Any] = None,
     ):
-        super().__init__(base_url, timeout)
+        super().__init__(base_url, timeout, session)
         self.wallet = wallet
         self.vault_address = vault_address
         self.account_address = account_address
-        self.info = Info(base_url, True, meta, spot_meta, perp_dexs, timeout)
+        self.info = Info(base_url, True, meta, spot_meta, perp_dexs, timeout, session=self.session)
         self.expires_after: Optional[int] = None
 
     def _post_action(self, action, signature, nonce):
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Iterable, Mapping, Optional
 
@@ -82,11 +83,26 @@ class GitHubSourceControlHistoryItemDetailsProvider:
             _LOGGER.warning("Commit %s:%s does not expose an author", normalised_repo, sha)
         return details
 
-    def get_commit_authors(self, repo: str, shas: Iterable[str]) -> Dict[str, Optional[CommitAuthor]]:
-        """Batch lookup helper used by attribution pipelines."""
+    def get_commit_authors(
+        self, repo: str, shas: Iterable[str], max_workers: int = 1
+    ) -> Dict[str, Optional[CommitAuthor]]:
+        """Batch lookup helper used by attribution pipelines.
+
+        Lookups are serial by default, as GitHub recommends to avoid secondary
+        rate limits (failed lookups are reported as ``None``). Pass
+        ``max_workers`` > 1 to opt into a thread pool; results keep the order
+        of ``shas`` either way.
+        """
+        sha_list = list(shas)
+        workers = min(max_workers, len(sha_list))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                lookups = list(executor.map(lambda sha: self.get_commit_author_details(repo, sha), sha_list))
+        else:
+            lookups = [self.get_commit_author_details(repo, sha) for sha in sha_list]
+
         results: Dict[str, Optional[CommitAuthor]] = {}
-        for sha in shas:
-            details = self.get_commit_author_details(repo, sha)
+        for sha, details in zip(sha_list, lookups):
             if details is None:
                 _LOGGER.warning("Failed to fetch GitHub commit %s:%s", _normalise_repo(repo), sha)
             results[sha] = details
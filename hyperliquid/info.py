@@ -25,8 +25,9 @@ class Info(API):
         # the original dex.
         perp_dexs: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        session: Optional[Any] = None,
     ):  # pylint: disable=too-many-locals
-        super().__init__(base_url, timeout)
+        super().__init__(base_url, timeout, session)
         self.ws_manager: Optional[WebsocketManager] = None
         if not skip_ws:
             self.ws_manager = WebsocketManager(self.base_url)
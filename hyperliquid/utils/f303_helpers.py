@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, wait
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from hyperliquid.info import Info
@@ -11,6 +14,25 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
 DEFAULT_VAULT_ID = "f303"
 DEFAULT_OWNER_ADDRESS = "0xcd5051944f780a621ee62e39e493c489668acf4d"
 
+# The f303 tooling only issues raw ``/info`` queries, so the asset metadata the
+# ``Info`` constructor normally downloads is never consulted.
+_EMPTY_META: Dict[str, Any] = {"universe": []}
+_EMPTY_SPOT_META: Dict[str, Any] = {"universe": [], "tokens": []}
+
+# Plain decimals without leading zeros already read exactly as Decimal would
+# render them, so they can skip the Decimal round-trip.
+_PLAIN_DECIMAL_RE = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?")
+
+
+def create_info_client(base_url: str) -> "Info":
+    """Return an ``Info`` client without the ``meta``/``spotMeta`` bootstrap requests.
+
+    Every query made through the client shares its keep-alive HTTP session.
+    """
+    from hyperliquid.info import Info
+
+    return Info(base_url, skip_ws=True, meta=_EMPTY_META, spot_meta=_EMPTY_SPOT_META)  # type: ignore[arg-type]
+
 
 def fetch_leaderboard(info: "Info", vault_id: str) -> Dict[str, Any]:
     """Return the leaderboard payload for a vault."""
@@ -21,17 +43,47 @@ def fetch_leaderboard(info: "Info", vault_id: str) -> Dict[str, Any]:
     return leaderboard
 
 
+def fetch_vault_snapshot(info: "Info", vault_id: str, owner_address: str) -> Tuple[Dict[str, Any], Any]:
+    """Return the vault leaderboard and the owner's clearinghouse state.
+
+    ``/info`` has no batch form, so the two independent queries are issued
+    concurrently over the client's session to pay a single round-trip of
+    latency instead of two.
+
+    Both queries always run to completion. If either fails, the error is
+    re-raised in call order (leaderboard first), as when the queries ran one
+    after the other; the other query's result is discarded.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leaderboard = executor.submit(fetch_leaderboard, info, vault_id)
+        clearinghouse_state = executor.submit(info.user_state, owner_address)
+        wait((leaderboard, clearinghouse_state))
+    return leaderboard.result(), clearinghouse_state.result()
+
+
+def render_json(payload: Any) -> str:
+    """Return ``payload`` as indented JSON, stringifying values JSON cannot encode."""
+    return json.dumps(payload, indent=2, default=str)
+
+
 def format_withdrawable(raw_withdrawable: Any) -> str:
     """Render the clearinghouse withdrawable balance for human readers."""
     if raw_withdrawable is None:
         return "Withdrawable amount unavailable in clearinghouse response."
 
-    try:
-        withdrawable_decimal = Decimal(str(raw_withdrawable))
-    except (InvalidOperation, ValueError):
-        return f"Withdrawable (unparsed): {raw_withdrawable}"
+    # The API reports balances as decimal strings; only coerce other types.
+    # Decimal keeps the exact figure, which a float round-trip would not.
+    text = raw_withdrawable if type(raw_withdrawable) is str else str(raw_withdrawable)
+    if _PLAIN_DECIMAL_RE.fullmatch(text):
+        withdrawable_str = text
+    else:
+        # Exponents, signs, padding and the like still go through Decimal.
+        try:
+            withdrawable_decimal = Decimal(text)
+        except (InvalidOperation, ValueError):
+            return f"Withdrawable (unparsed): {raw_withdrawable}"
+        withdrawable_str = format(withdrawable_decimal, "f")
 
-    withdrawable_str = format(withdrawable_decimal, "f")
     if "." in withdrawable_str:
         withdrawable_str = withdrawable_str.rstrip("0").rstrip(".")
     return f"Withdrawable: {withdrawable_str}"
@@ -14,7 +14,6 @@ from hyperliquid.utils import constants
 from claim_kin_agent_attribution.builder_codes import (
     BuilderCode,
     fetch_builder_codes,
-    filter_builder_codes,
 )
 
 
@@ -60,10 +59,11 @@ def _format_line(code: BuilderCode) -> str:
 def _emit_json(codes: Sequence[BuilderCode], stream, output: Path | None) -> None:
     payload = [code.as_dict() for code in codes]
     document = {"count": len(codes), "builder_codes": payload}
-    json.dump(document, stream, indent=2)
-    stream.write("\n")
+    # Serialise once and reuse the text for both stdout and the output file.
+    rendered = json.dumps(document, indent=2) + "\n"
+    stream.write(rendered)
     if output is not None:
-        output.write_text(json.dumps(document, indent=2) + "\n")
+        output.write_text(rendered)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -71,8 +71,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     info = Info(args.api_url, skip_ws=True)
-    codes = fetch_builder_codes(info)
-    filtered = filter_builder_codes(codes, args.builders)
+    filtered = fetch_builder_codes(info, filter_addresses=args.builders)
 
     if args.json or args.output is not None:
         _emit_json(filtered, sys.stdout, args.output)
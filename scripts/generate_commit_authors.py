@@ -112,24 +112,51 @@ def _recent_commits(limit: int, rev: str) -> list[str]:
     return commits
 
 
+def _local_author(sha: str) -> Optional[CommitAuthor]:
+    try:
+        result = subprocess.run(
+            ["git", "show", "-s", "--format=%an", sha],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError:
+        return None
+    name = result.stdout.strip()
+    if name:
+        return CommitAuthor(identifier=name, source="git.log")
+    return None
+
+
 def _local_authors(commits: Iterable[str]) -> Dict[str, Optional[CommitAuthor]]:
+    shas = list(commits)
+    if not shas:
+        return {}
+    # Resolve every commit with a single ``git log`` process instead of one
+    # ``git show`` per SHA; fall back to per-commit lookups only if git
+    # rejects the batch (e.g. because one of the SHAs is unknown).
+    try:
+        result = subprocess.run(
+            ["git", "log", "--no-walk=unsorted", "--format=%H%x00%an", *shas, "--"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError:
+        return {sha: _local_author(sha) for sha in shas}
+
+    names: Dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        full_sha, _, name = line.partition("\x00")
+        names[full_sha] = name.strip()
+
     authors: Dict[str, Optional[CommitAuthor]] = {}
-    for sha in commits:
-        try:
-            result = subprocess.run(
-                ["git", "show", "-s", "--format=%an", sha],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError:
-            authors[sha] = None
-            continue
-        name = result.stdout.strip()
-        if name:
-            authors[sha] = CommitAuthor(identifier=name, source="git.log")
-        else:
-            authors[sha] = None
+    for sha in shas:
+        resolved = names.get(sha)
+        if resolved is None:
+            # Abbreviated SHAs are reported in full by git log.
+            resolved = next((value for key, value in names.items() if key.startswith(sha)), "")
+        authors[sha] = CommitAuthor(identifier=resolved, source="git.log") if resolved else None
     return authors
 
 
@@ -145,6 +172,25 @@ def _prepare_output_directory(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _write_atomic(path: Path, text: str) -> None:
+    """Write ``text`` next to ``path`` and rename it into place.
+
+    Readers of the author map never observe a partially written file, even if
+    the process is interrupted mid-write. The data is flushed to disk before
+    the rename, and the temporary file is removed if anything fails.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp_path.open("w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _serialise_author(author: Optional[CommitAuthor]) -> Optional[Dict[str, str]]:
     if author is None:
         return None
@@ -210,7 +256,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     }
 
     _prepare_output_directory(args.output)
-    args.output.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    _write_atomic(args.output, json.dumps(payload, indent=2, sort_keys=True) + "\n")
     print(f"Wrote author map for {len(commits)} commits to {args.output}")
     return 0
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Dict
 
 from hyperliquid import github as github_module
@@ -116,3 +117,29 @@ def test_get_commit_authors_uses_normalised_repo():
     )
     results = provider.get_commit_authors("https://github.com/foo/bar", ["sha"])
     assert results["sha"].identifier == "octocat"
+
+
+def test_get_commit_authors_preserves_order_with_thread_pool():
+    shas = [f"sha{index}" for index in range(20)]
+    provider = GitHubSourceControlHistoryItemDetailsProvider(
+        session=FakeSession({sha: FakeResponse({"author": {"login": f"user-{sha}"}}) for sha in shas})
+    )
+    results = provider.get_commit_authors("foo/bar", shas, max_workers=4)
+    assert list(results) == shas
+    assert [author.identifier for author in results.values()] == [f"user-{sha}" for sha in shas]
+
+
+def test_get_commit_authors_is_serial_by_default():
+    shas = ["a", "b", "c"]
+    threads = []
+
+    class _RecordingSession(FakeSession):
+        def get(self, url, headers=None, timeout=None):
+            threads.append(threading.get_ident())
+            return super().get(url, headers=headers, timeout=timeout)
+
+    provider = GitHubSourceControlHistoryItemDetailsProvider(
+        session=_RecordingSession({sha: FakeResponse({"author": {"login": sha}}) for sha in shas})
+    )
+    provider.get_commit_authors("foo/bar", shas)
+    assert threads == [threading.get_ident()] * len(shas)
@@ -7,6 +7,15 @@ TEST_META: Meta = {"universe": []}
 TEST_SPOT_META: SpotMeta = {"universe": [], "tokens": []}
 
 
+def test_info_uses_injected_session():
+    import requests
+
+    session = requests.Session()
+    info = Info(skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META, session=session)
+    assert info.session is session
+    assert session.headers["Content-Type"] == "application/json"
+
+
 @pytest.mark.vcr()
 def test_get_user_state():
     info = Info(skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META)
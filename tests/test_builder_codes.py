@@ -1,7 +1,10 @@
 """Tests for extracting builder referral codes from metadata payloads."""
 from __future__ import annotations
 
+import copy
+import dataclasses
 import json
+import pickle
 from typing import Any, Iterable, List
 
 import pytest
@@ -16,8 +19,10 @@ from claim_kin_agent_attribution.builder_codes import (
 class _FakeInfo:
     def __init__(self, payload: Any) -> None:
         self._payload = payload
+        self.calls = 0
 
     def perp_dexs(self) -> Any:
+        self.calls += 1
         return self._payload
 
 
@@ -61,18 +66,58 @@ def test_parse_builder_codes_handles_varied_payloads(sample_payload: Iterable[di
     assert codes[2].share_bps == 12
 
 
+def test_parse_builder_codes_unwraps_nested_payloads(sample_payload: List[dict[str, Any]]) -> None:
+    payload = {"result": {"data": [sample_payload[:2], [sample_payload[2:]]]}}
+    codes = parse_builder_codes(payload)
+    assert [code.dex for code in codes] == ["solarak1n", "keeper_f303", "atlas_core"]
+
+
 def test_fetch_builder_codes_uses_info(sample_payload: Iterable[dict[str, Any]]) -> None:
     info = _FakeInfo(sample_payload)
     codes = fetch_builder_codes(info)  # type: ignore[arg-type]
     assert len(codes) == 3
 
 
+def test_fetch_builder_codes_reuses_recent_payload(sample_payload: Iterable[dict[str, Any]]) -> None:
+    info = _FakeInfo(sample_payload)
+    fetch_builder_codes(info)  # type: ignore[arg-type]
+    fetch_builder_codes(info, limit=1)  # type: ignore[arg-type]
+    assert info.calls == 1
+
+    fetch_builder_codes(info, max_age=0)  # type: ignore[arg-type]
+    assert info.calls == 2
+
+
 def test_filter_builder_codes_restricts_to_known_addresses(sample_payload: Iterable[dict[str, Any]]) -> None:
     codes = parse_builder_codes(sample_payload)
     filtered = filter_builder_codes(codes, ["0x3333333333333333333333333333333333333333"])
     assert [code.dex for code in filtered] == ["atlas_core"]
 
 
+def test_filter_builder_codes_normalises_and_ignores_invalid_addresses(
+    sample_payload: Iterable[dict[str, Any]],
+) -> None:
+    codes = parse_builder_codes(sample_payload)
+    filtered = filter_builder_codes(
+        codes,
+        ["  2222222222222222222222222222222222222222 ", "0xZZ22222222222222222222222222222222222222"],
+    )
+    assert [code.dex for code in filtered] == ["keeper_f303"]
+
+
+def test_parse_builder_codes_applies_filter_and_limit(sample_payload: Iterable[dict[str, Any]]) -> None:
+    filtered = parse_builder_codes(
+        sample_payload,
+        filter_addresses=["0x2222222222222222222222222222222222222222", "0x3333333333333333333333333333333333333333"],
+    )
+    assert [code.dex for code in filtered] == ["keeper_f303", "atlas_core"]
+
+    limited = parse_builder_codes(sample_payload, limit=2)
+    assert [code.dex for code in limited] == ["solarak1n", "keeper_f303"]
+
+    assert len(parse_builder_codes(sample_payload, filter_addresses=[])) == 3
+
+
 def test_builder_code_serialisation_contains_metadata(sample_payload: Iterable[dict[str, Any]]) -> None:
     codes = parse_builder_codes(sample_payload)
     payload = codes[0].as_dict()
@@ -82,6 +127,14 @@ def test_builder_code_serialisation_contains_metadata(sample_payload: Iterable[d
     assert json.loads(json.dumps(metadata))  # ensure serialisable
 
 
+def test_builder_code_round_trips_through_pickle_copy_and_asdict(sample_payload: List[dict[str, Any]]) -> None:
+    code = parse_builder_codes(sample_payload)[0]
+    assert pickle.loads(pickle.dumps(code)) == code
+    assert copy.deepcopy(code) == code
+    assert dataclasses.asdict(code)["metadata"] == code.as_dict()["metadata"]
+    json.dumps(code.as_dict())
+
+
 def test_cli_outputs_expected_json(monkeypatch: pytest.MonkeyPatch, sample_payload: List[dict[str, Any]], capsys) -> None:
     import scripts.find_builder_codes as cli
 
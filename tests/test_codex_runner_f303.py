@@ -0,0 +1,66 @@
+"""Tests for the f303 vault leaderboard runner."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import pytest
+
+import codex_runner_f303 as runner
+
+
+@pytest.mark.parametrize(
+    "vault, expected",
+    [
+        ({"vaultAddress": "0xdfC24b077bC1425Ad1DeA75BCB6F8158E10Df303"}, True),
+        ({"address": "0x00000000000000000000000000000000000AF303"}, True),
+        ({"id": "", "name": "KinLend F303 Vault"}, True),
+        ({"vaultAddress": "0xabc", "displayName": "keeper-f303"}, True),
+        ({"vaultAddress": "0xabc", "name": "Other"}, False),
+        ({"vaultAddress": None, "address": "0xabc", "vaultName": "f30"}, False),
+        ({}, False),
+    ],
+)
+def test_is_f303_vault(vault: Dict[str, Any], expected: bool) -> None:
+    assert runner._is_f303_vault(vault) is expected
+
+
+def test_fetch_vaults_unwraps_nested_leaderboard() -> None:
+    class _Client:
+        def post(self, url_path: str, payload: Dict[str, Any]) -> Any:
+            assert payload == {"type": "vaultLeaderboard"}
+            return {"leaderboard": {"vaults": [{"name": "a"}, "skip", {"name": "b"}]}}
+
+    vaults = runner.fetch_vaults(_Client())  # type: ignore[arg-type]
+    assert vaults == [{"name": "a"}, {"name": "b"}]
+
+
+def test_format_vault_keeps_zero_values_and_hides_raw_by_default() -> None:
+    vault = {"vaultAddress": "0xabc", "name": "KinLend f303", "aum": 0, "tvl": 5, "apy": 0.1}
+
+    summary = runner._format_vault(vault)
+    assert "  • AUM: 0" in summary.splitlines()
+    assert "Raw:" not in summary
+
+    assert "  • Raw: {" in runner._format_vault(vault, verbose=True)
+
+
+def test_format_vault_skips_empty_text_fields_like_the_filter() -> None:
+    vault = {
+        "vaultAddress": "",
+        "address": "0xabcf303",
+        "name": "",
+        "vaultName": "KinLend",
+        "manager": "",
+        "owner": "0xo",
+        "aum": "",
+        "tvl": 5,
+        "apy": 0,
+    }
+
+    assert runner._is_f303_vault(vault)
+    lines = runner._format_vault(vault).splitlines()
+    assert lines[0] == "Vault: KinLend (0xabcf303)"
+    assert "  • Manager: 0xo" in lines
+    assert "  • AUM: 5" in lines
+    assert "  • APY: 0" in lines
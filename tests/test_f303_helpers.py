@@ -1,4 +1,12 @@
-from hyperliquid.utils.f303_helpers import format_withdrawable
+import json
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from hyperliquid.api import API
+from hyperliquid.utils.f303_helpers import create_info_client, fetch_vault_snapshot, format_withdrawable, render_json
 
 
 def test_format_withdrawable_integer():
@@ -11,3 +19,81 @@ def test_format_withdrawable_trim_trailing_zeroes():
 
 def test_format_withdrawable_small_decimal():
     assert format_withdrawable("0.0001000") == "Withdrawable: 0.0001"
+
+
+def test_format_withdrawable_non_canonical_inputs_use_decimal():
+    assert format_withdrawable("1e3") == "Withdrawable: 1000"
+    assert format_withdrawable("001.50") == "Withdrawable: 1.5"
+    assert format_withdrawable("abc") == "Withdrawable (unparsed): abc"
+
+
+def test_render_json_is_indented_json():
+    rendered = render_json({"vaults": [{"name": "f303"}]})
+    assert json.loads(rendered) == {"vaults": [{"name": "f303"}]}
+    assert '\n  "vaults": [' in rendered
+
+
+def test_render_json_handles_integers_wider_than_64_bits():
+    assert json.loads(render_json({"equity": 2**70})) == {"equity": 2**70}
+
+
+def test_render_json_stringifies_values_json_cannot_encode():
+    assert json.loads(render_json({"equity": Decimal("1.50")})) == {"equity": "1.50"}
+
+
+def test_create_info_client_skips_metadata_bootstrap(monkeypatch: pytest.MonkeyPatch):
+    def fail_post(self, url_path, payload=None):
+        raise AssertionError(f"unexpected request {payload!r}")
+
+    monkeypatch.setattr(API, "post", fail_post)
+    info = create_info_client("https://api.example")
+    assert info.base_url == "https://api.example"
+    assert info.ws_manager is None
+
+
+def test_fetch_vault_snapshot_overlaps_requests():
+    # Both calls must be in flight together for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _Info:
+        def post(self, url_path, payload):
+            barrier.wait()
+            return {"vault": payload["vault"]}
+
+        def user_state(self, address):
+            barrier.wait()
+            return {"withdrawable": "1", "user": address}
+
+    leaderboard, state = fetch_vault_snapshot(_Info(), "f303", "0xowner")
+    assert leaderboard == {"vault": "f303"}
+    assert state == {"withdrawable": "1", "user": "0xowner"}
+
+
+def test_fetch_vault_snapshot_raises_after_both_requests_finish():
+    finished = []
+
+    class _Info:
+        def post(self, url_path, payload):
+            time.sleep(0.05)
+            finished.append("leaderboard")
+            return {"vault": payload["vault"]}
+
+        def user_state(self, address):
+            raise RuntimeError("user_state failed")
+
+    with pytest.raises(RuntimeError, match="user_state failed"):
+        fetch_vault_snapshot(_Info(), "f303", "0xowner")
+    assert finished == ["leaderboard"]
+
+
+def test_fetch_vault_snapshot_reports_the_leaderboard_error_first():
+    class _Info:
+        def post(self, url_path, payload):
+            time.sleep(0.05)
+            raise RuntimeError("leaderboard failed")
+
+        def user_state(self, address):
+            raise RuntimeError("user_state failed")
+
+    with pytest.raises(RuntimeError, match="leaderboard failed"):
+        fetch_vault_snapshot(_Info(), "f303", "0xowner")
@@ -0,0 +1,83 @@
+import subprocess
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from claim_kin_agent_attribution.github_helpers import CommitAuthor
+
+FULL_SHA = "a" * 40
+ABBREVIATED_SHA = "b" * 40
+MISSING_SHA = "c" * 40
+
+
+def test_local_authors_resolves_batched_git_log_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    import scripts.generate_commit_authors as cli
+
+    calls: List[List[str]] = []
+
+    def fake_run(args: List[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        stdout = f"{FULL_SHA}\x00Alice\n{ABBREVIATED_SHA}\x00Bob\n{MISSING_SHA}\x00\n"
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    authors = cli._local_authors([FULL_SHA, ABBREVIATED_SHA[:7], MISSING_SHA, "d" * 7])
+
+    assert len(calls) == 1
+    assert calls[0][:3] == ["git", "log", "--no-walk=unsorted"]
+    assert authors == {
+        FULL_SHA: CommitAuthor(identifier="Alice", source="git.log"),
+        ABBREVIATED_SHA[:7]: CommitAuthor(identifier="Bob", source="git.log"),
+        MISSING_SHA: None,
+        "d" * 7: None,
+    }
+
+
+def test_local_authors_falls_back_to_per_commit_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    import scripts.generate_commit_authors as cli
+
+    def fake_run(args: List[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        if args[1] == "log":
+            raise subprocess.CalledProcessError(128, args)
+        if args[-1] == MISSING_SHA:
+            raise subprocess.CalledProcessError(128, args)
+        return subprocess.CompletedProcess(args, 0, stdout="Alice\n", stderr="")
+
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    assert cli._local_authors([FULL_SHA, MISSING_SHA]) == {
+        FULL_SHA: CommitAuthor(identifier="Alice", source="git.log"),
+        MISSING_SHA: None,
+    }
+
+
+def test_write_atomic_replaces_the_target(tmp_path: Path) -> None:
+    import scripts.generate_commit_authors as cli
+
+    target = tmp_path / "commit_author_map.json"
+    target.write_text("old\n")
+
+    cli._write_atomic(target, "new\n")
+
+    assert target.read_text() == "new\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["commit_author_map.json"]
+
+
+def test_write_atomic_removes_the_temp_file_on_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import scripts.generate_commit_authors as cli
+
+    target = tmp_path / "commit_author_map.json"
+    target.write_text("old\n")
+
+    def fail_replace(src: Path, dst: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cli.os, "replace", fail_replace)
+
+    with pytest.raises(OSError):
+        cli._write_atomic(target, "new\n")
+
+    assert target.read_text() == "old\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["commit_author_map.json"]